@@ -1,16 +1,70 @@
 """Main MTG Card Bot Discord bot implementation."""
 
 import asyncio
+import hashlib
 import re
 import time
-from contextlib import suppress
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from typing import Any, ClassVar
 
 import discord
 
 from . import config, errors, logging
-from .grid import compose_card_grid
+from .cache import TTLCache
+from .grid import CardImageFetcher, compose_card_grid
 from .scryfall import Card, ScryfallClient
 
+# Bracket lookup syntax: [[card name]]
+_BRACKET_RE = re.compile(r"\[\[([^\]]+)\]\]")
+
+# Scryfall filter prefixes that route a query through the search API
+_FILTER_PARAMS = (
+    "e:",
+    "s:",
+    "set:",
+    "frame:",
+    "border:",
+    "is:",
+    "rarity:",
+    "r:",
+    "cn:",
+    "number:",
+    "c:",
+    "color:",
+    "id:",
+    "t:",
+    "type:",
+    "o:",
+    "oracle:",
+    "pow:",
+    "tou:",
+    "cmc:",
+    "mv:",
+    "f:",
+    "format:",
+)
+_FILTER_RE = re.compile("|".join(re.escape(param) for param in _FILTER_PARAMS))
+
+# Standalone filter keywords that are not part of a card name
+_FILTER_KEYWORDS = frozenset({"foil", "nonfoil", "fullart", "textless", "borderless"})
+
+# Embed accent colors by card rarity
+_RARITY_COLORS = {
+    "mythic": 0xFF8C00,  # Dark orange
+    "rare": 0xFFD700,  # Gold
+    "uncommon": 0xC0C0C0,  # Silver
+    "common": 0x000000,  # Black
+    "special": 0xFF1493,  # Deep pink
+    "bonus": 0x9370DB,  # Medium purple
+}
+
+_RANDOM_ALIASES = frozenset({"random", "rand", "r"})
+
+type _CommandHandler = Callable[
+    ["MTGCardBot", discord.Message, list[str]], Coroutine[Any, Any, None]
+]
+
 
 class MultiResolvedCard:
     """Container for a resolved card query in multi-card lookups."""
@@ -31,6 +85,13 @@ class MultiResolvedCard:
 class MTGCardBot(discord.Client):
     """Discord bot for Magic: The Gathering card lookups."""
 
+    MULTI_LOOKUP_CONCURRENCY = 8  # Max card queries resolved at once per message
+    PROCESSED_MESSAGE_ID_LIMIT = 4096  # Recent message IDs kept for redelivery checks
+    CARD_CACHE_SIZE = 2048  # Resolved card queries kept in memory
+    CARD_CACHE_TTL = 600.0  # Seconds before a cached resolution is refetched
+    RECENT_ACTIVITY_TTL = 300.0  # Seconds dedup/rate-limit stamps are kept
+    CLEANUP_MIN_INTERVAL = 60.0  # Minimum seconds between cleanup passes
+
     def __init__(self, cfg: config.MTGConfig) -> None:
         """Initialize the MTG Card Bot."""
         intents = discord.Intents.default()
@@ -40,17 +101,32 @@ class MTGCardBot(discord.Client):
 
         self.logger = logging.with_component("mtg_card_bot")
         self.scryfall_client = ScryfallClient()
+        # Long-lived image fetcher so grid downloads reuse pooled connections
+        # and recently fetched card images
+        self.image_fetcher = CardImageFetcher()
+        # Resolved (query, order, direction) -> (card, used_fallback)
+        self._card_cache: TTLCache[
+            tuple[str, str | None, str | None], tuple[Card, bool]
+        ] = TTLCache(self.CARD_CACHE_SIZE, self.CARD_CACHE_TTL)
 
         # Enhanced duplicate suppression structures
-        # Track recent (author, normalized_content) to timestamp
-        self._recent_commands: dict[tuple[int, str], float] = {}
-        # Track processed Discord message IDs
-        self._processed_message_ids: set[int] = set()
-        # Background cleanup task
-        self._cleanup_task: asyncio.Task[None] | None = None
+        # Track recent (author, normalized_content digest) to timestamp, kept
+        # oldest-first so cleanup only visits expired entries
+        self._recent_commands: OrderedDict[tuple[int, bytes], float] = OrderedDict()
+        # Track processed Discord message IDs (oldest first, capped)
+        self._processed_message_ids: OrderedDict[int, None] = OrderedDict()
+        # Strong references to background tasks; the event loop only keeps
+        # weak ones, so an unreferenced task can be collected mid-run
+        self._bg_tasks: set[asyncio.Task[None]] = set()
+        # Wakes the cleanup task when the first entry arrives
+        self._cleanup_wakeup = asyncio.Event()
+
+        # The help text only depends on the configured prefix
+        self._help_embed = self._build_help_embed()
 
         # Performance improvements
-        self._user_rate_limits: dict[int, float] = {}  # Track per-user rate limits
+        # Track per-user rate limits (last command time, oldest first)
+        self._user_rate_limits: OrderedDict[int, float] = OrderedDict()
 
     async def start(self, token: str | None = None, *, reconnect: bool = True) -> None:
         """Start the Discord client with the configured token by default."""
@@ -60,9 +136,7 @@ class MTGCardBot(discord.Client):
     async def setup_hook(self) -> None:
         """Called when the bot is starting up."""
         # Start background cleanup task
-        self._cleanup_task = asyncio.create_task(
-            self._cleanup_duplicates_periodically()
-        )
+        self._spawn(self._cleanup_duplicates_periodically())
         self.logger.info("MTG Card bot setup completed")
 
     async def on_ready(self) -> None:
@@ -134,26 +208,39 @@ class MTGCardBot(discord.Client):
             )
             return
 
-        # If we've already processed this message (duplicate delivery), skip
+        # Cheap substring checks reject ordinary chat before any regex work
+        raw_content = message.content
+        prefix = self.config.command_prefix
+        if "[[" not in raw_content and not raw_content.startswith(prefix):
+            return
+
+        # If we've already seen this message (duplicate delivery), skip
         if message.id in self._processed_message_ids:
             return
+        self._remember_message_id(message.id)
 
         # Check for bracket syntax [[card name]] or prefix command
-        bracket_match = self._extract_bracket_content(message.content)
+        bracket_match = self._extract_bracket_content(raw_content)
         if bracket_match:
             content = bracket_match
-        elif message.content.startswith(self.config.command_prefix):
+        elif raw_content.startswith(prefix):
             # Remove prefix
-            content = message.content[len(self.config.command_prefix) :]
+            content = raw_content[len(prefix) :]
         else:
             return
 
+        # Tokenize once; the joined and lowered forms are reused below
+        parts = content.split()
+        if not parts:
+            return
+        joined = " ".join(parts)
+
         # Check per-user rate limiting
         user_id = message.author.id
-        now = time.time()
-        last_command = self._user_rate_limits.get(user_id, 0)
+        now = time.monotonic()
+        last_command = self._user_rate_limits.get(user_id)
         cooldown = self.config.command_cooldown
-        if cooldown > 0 and now - last_command < cooldown:
+        if last_command is not None and cooldown > 0 and now - last_command < cooldown:
             self.logger.debug(
                 "Rate limited user",
                 user_id=str(user_id),
@@ -162,10 +249,16 @@ class MTGCardBot(discord.Client):
             )
             return
         self._user_rate_limits[user_id] = now
+        self._user_rate_limits.move_to_end(user_id)
+        self._cleanup_wakeup.set()
 
         # Enhanced duplicate suppression with longer window and better logging
-        normalized = " ".join(content.lower().split())
-        key = (message.author.id, normalized)
+        normalized = joined.lower()
+        # Key on a fixed-size digest so stored keys don't grow with command length
+        digest = hashlib.blake2b(
+            normalized.encode("utf-8", "ignore"), digest_size=8
+        ).digest()
+        key = (message.author.id, digest)
         last = self._recent_commands.get(key)
 
         # Suppress duplicates within 2.5 seconds
@@ -180,42 +273,54 @@ class MTGCardBot(discord.Client):
             return
 
         self._recent_commands[key] = now
-        self._processed_message_ids.add(message.id)
+        self._recent_commands.move_to_end(key)
 
         # If the content contains semicolons, treat as multi-card lookup
         if ";" in content:
             await self._handle_multi_card_lookup(message, content)
             return
 
-        parts = content.split()
-        if not parts:
-            return
-
         command = parts[0].lower()
         args = parts[1:]
 
         # Handle specific commands with aliases
-        if command in ["random", "rand", "r"]:
-            # Support filtered random: "random e:who rarity:mythic"
-            if args:
-                filter_query = " ".join(args)
-                await self._handle_random_card(message, filter_query)
-            else:
-                await self._handle_random_card(message)
-        elif command in ["help", "h", "?"]:
-            await self._handle_help(message)
-        elif command == "rules":
-            if args:
-                card_query = " ".join(args)
-                await self._handle_rules_lookup(message, card_query)
-            else:
-                await self._send_error_message(
-                    message.channel, "Please provide a card name for rules lookup."
-                )
+        handler = self._COMMAND_HANDLERS.get(command)
+        if handler is not None:
+            await handler(self, message, args)
         else:
             # Treat as card lookup
-            card_query = " ".join(parts)
-            await self._handle_card_lookup(message, card_query)
+            await self._handle_card_lookup(message, joined)
+
+    async def _command_random(self, message: discord.Message, args: list[str]) -> None:
+        """Dispatch the random command."""
+        # Support filtered random: "random e:who rarity:mythic"
+        if args:
+            await self._handle_random_card(message, " ".join(args))
+        else:
+            await self._handle_random_card(message)
+
+    async def _command_help(self, message: discord.Message, args: list[str]) -> None:
+        """Dispatch the help command."""
+        await self._handle_help(message)
+
+    async def _command_rules(self, message: discord.Message, args: list[str]) -> None:
+        """Dispatch the rules command, which requires a card name."""
+        if not args:
+            await self._send_error_message(
+                message.channel, "Please provide a card name for rules lookup."
+            )
+            return
+        await self._handle_rules_lookup(message, " ".join(args))
+
+    # Command word (including aliases) -> handler.
+    # Anything not listed here is treated as a card lookup.
+    _COMMAND_HANDLERS: ClassVar[dict[str, _CommandHandler]] = {
+        **dict.fromkeys(_RANDOM_ALIASES, _command_random),
+        "help": _command_help,
+        "h": _command_help,
+        "?": _command_help,
+        "rules": _command_rules,
+    }
 
     async def _handle_random_card(
         self, message: discord.Message, filter_query: str = ""
@@ -377,6 +482,15 @@ class MTGCardBot(discord.Client):
         has_filters = bool(order_hint) or self._has_filter_parameters(search_query)
         used_fallback = False
 
+        # Unsorted filtered searches pick a random print each time, so only
+        # deterministic resolutions are cached.
+        cache_key = (" ".join(search_query.lower().split()), order_hint, direction_hint)
+        cacheable = not has_filters or order_hint is not None
+        if cacheable:
+            cached = self._card_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         if has_filters:
             # Use search API for filtered queries
             try:
@@ -418,15 +532,16 @@ class MTGCardBot(discord.Client):
                 errors.ErrorType.NOT_FOUND, "No card found for query"
             )
 
+        if cacheable:
+            self._card_cache.set(cache_key, (card, used_fallback))
         return card, used_fallback
 
     async def _handle_multi_card_lookup(
         self, message: discord.Message, raw_content: str
     ) -> None:
         """Handle a semicolon-separated list of card queries."""
-        # Split on semicolons and trim spaces
-        raw_parts = raw_content.split(";")
-        queries = [q.strip() for q in raw_parts if q.strip()]
+        # Split on semicolons and trim spaces, stripping each part only once
+        queries = [q for q in (part.strip() for part in raw_content.split(";")) if q]
 
         if not queries:
             await self._send_error_message(
@@ -452,7 +567,7 @@ class MTGCardBot(discord.Client):
                 parts = query.split()
                 command = parts[0].lower() if parts else ""
                 # Handle random commands within multi-card lookups
-                if command in ("random", "rand", "r"):
+                if command in _RANDOM_ALIASES:
                     filter_query = " ".join(parts[1:])
                     card = await self.scryfall_client.get_random_card(filter_query)
                     return MultiResolvedCard(query, card)
@@ -461,9 +576,14 @@ class MTGCardBot(discord.Client):
             except Exception as e:
                 return MultiResolvedCard(query, error=e)
 
+        # Bound fan-out so long lists don't flood Scryfall; the timeout only
+        # starts once a query holds a slot.
+        semaphore = asyncio.Semaphore(self.MULTI_LOOKUP_CONCURRENCY)
+
         async def _resolve_with_timeout(query: str) -> MultiResolvedCard:
             try:
-                return await asyncio.wait_for(_resolve_one(query), timeout=20.0)
+                async with semaphore:
+                    return await asyncio.wait_for(_resolve_one(query), timeout=20.0)
             except TimeoutError:
                 self.logger.warning("Card resolution timed out", query=query)
                 return MultiResolvedCard(
@@ -506,7 +626,7 @@ class MTGCardBot(discord.Client):
         # Build the composite grid image
         cards_for_grid = [card for _, card in valid_cards]
         try:
-            grid_buffer = await compose_card_grid(cards_for_grid)
+            grid_buffer = await compose_card_grid(cards_for_grid, self.image_fetcher)
         except Exception as e:
             self.logger.error("Grid composition failed", error=str(e))
             await self._send_error_message(
@@ -552,34 +672,7 @@ class MTGCardBot(discord.Client):
 
     def _has_filter_parameters(self, query: str) -> bool:
         """Check if the query contains Scryfall filter syntax."""
-        essential_filters = [
-            "e:",
-            "s:",
-            "set:",
-            "frame:",
-            "border:",
-            "is:",
-            "rarity:",
-            "r:",
-            "cn:",
-            "number:",
-            "c:",
-            "color:",
-            "id:",
-            "t:",
-            "type:",
-            "o:",
-            "oracle:",
-            "pow:",
-            "tou:",
-            "cmc:",
-            "mv:",
-            "f:",
-            "format:",
-        ]
-
-        lower_query = query.lower()
-        return any(filter_param in lower_query for filter_param in essential_filters)
+        return _FILTER_RE.search(query.lower()) is not None
 
     def _extract_sort_parameters(
         self, query: str
@@ -621,14 +714,7 @@ class MTGCardBot(discord.Client):
                 continue
 
             # Skip standalone filter keywords
-            essential_keywords = [
-                "foil",
-                "nonfoil",
-                "fullart",
-                "textless",
-                "borderless",
-            ]
-            if lower_word not in essential_keywords:
+            if lower_word not in _FILTER_KEYWORDS:
                 card_name_parts.append(word)
 
         return " ".join(card_name_parts).strip()
@@ -647,9 +733,7 @@ class MTGCardBot(discord.Client):
 
     def _extract_bracket_content(self, message_content: str) -> str | None:
         """Extract card name from bracket syntax [[card name]]."""
-        # Look for [[content]] pattern
-        bracket_pattern = r"\[\[([^\]]+)\]\]"
-        match = re.search(bracket_pattern, message_content)
+        match = _BRACKET_RE.search(message_content)
 
         if match:
             return match.group(1).strip()
@@ -792,15 +876,7 @@ class MTGCardBot(discord.Client):
 
     def _get_rarity_color(self, rarity: str) -> int:
         """Return a color based on card rarity."""
-        rarity_colors = {
-            "mythic": 0xFF8C00,  # Dark orange
-            "rare": 0xFFD700,  # Gold
-            "uncommon": 0xC0C0C0,  # Silver
-            "common": 0x000000,  # Black
-            "special": 0xFF1493,  # Deep pink
-            "bonus": 0x9370DB,  # Medium purple
-        }
-        return rarity_colors.get(rarity.lower(), 0x9B59B6)  # Default purple
+        return _RARITY_COLORS.get(rarity.lower(), 0x9B59B6)  # Default purple
 
     async def _handle_help(self, message: discord.Message) -> None:
         """Handle the help command."""
@@ -810,6 +886,10 @@ class MTGCardBot(discord.Client):
             username=message.author.name,
         )
 
+        await message.channel.send(embed=self._help_embed)
+
+    def _build_help_embed(self) -> discord.Embed:
+        """Build the help embed for the configured command prefix."""
         prefix = self.config.command_prefix
         embed = discord.Embed(
             title="MTG Card Bot",
@@ -867,7 +947,7 @@ class MTGCardBot(discord.Client):
             text="Powered by Scryfall API • github.com/dunamismax/mtg-card-bot"
         )
 
-        await message.channel.send(embed=embed)
+        return embed
 
     async def _send_error_message(
         self, channel: discord.abc.Messageable, message: str
@@ -884,38 +964,26 @@ class MTGCardBot(discord.Client):
         """Background task to clean up old duplicate suppression data."""
         while True:
             try:
-                await asyncio.sleep(60)  # Clean up every minute
-                now = time.time()
-                cutoff = now - 300  # Keep data for 5 minutes
+                delay = self._next_cleanup_delay(time.monotonic())
+                if delay is None:
+                    # Nothing to expire; sleep until a command is recorded
+                    self._cleanup_wakeup.clear()
+                    await self._cleanup_wakeup.wait()
+                    continue
+
+                await asyncio.sleep(delay)
+                cutoff = time.monotonic() - self.RECENT_ACTIVITY_TTL
 
                 # Clean up old command timestamps
-                old_keys = [
-                    key
-                    for key, timestamp in self._recent_commands.items()
-                    if timestamp < cutoff
-                ]
-                for key in old_keys:
-                    del self._recent_commands[key]
-
-                # Clean up old rate limit timestamps (keep for 5 minutes)
-                old_rate_limit_users = [
-                    user_id
-                    for user_id, timestamp in self._user_rate_limits.items()
-                    if timestamp < cutoff
-                ]
-                for user_id in old_rate_limit_users:
-                    del self._user_rate_limits[user_id]
-
-                # Clean up old message IDs (keep last 1000)
-                if len(self._processed_message_ids) > 1000:
-                    # Convert to list, sort, and keep newest 500
-                    sorted_ids = sorted(self._processed_message_ids)
-                    self._processed_message_ids = set(sorted_ids[-500:])
-
-                if old_keys or len(self._processed_message_ids) > 1000:
+                commands_removed = self._expire_entries(self._recent_commands, cutoff)
+
+                # Clean up old rate limit timestamps
+                self._expire_entries(self._user_rate_limits, cutoff)
+
+                if commands_removed:
                     self.logger.debug(
                         "Cleaned up duplicate suppression data",
-                        commands_removed=len(old_keys),
+                        commands_removed=commands_removed,
                         message_ids_kept=len(self._processed_message_ids),
                     )
 
@@ -924,15 +992,58 @@ class MTGCardBot(discord.Client):
             except Exception as e:
                 self.logger.error("Error in duplicate cleanup task", error=str(e))
 
+    def _next_cleanup_delay(self, now: float) -> float | None:
+        """Return seconds until the oldest tracked stamp expires, if any.
+
+        Passes are spaced at least ``CLEANUP_MIN_INTERVAL`` apart so steady
+        traffic expires entries in batches rather than one wakeup each.
+        """
+        oldest = [
+            next(iter(entries.values()))
+            for entries in (self._recent_commands, self._user_rate_limits)
+            if entries
+        ]
+        if not oldest:
+            return None
+        expires_in = min(oldest) + self.RECENT_ACTIVITY_TTL - now
+        return max(expires_in, self.CLEANUP_MIN_INTERVAL)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """Start a background task that is kept alive until it finishes."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    def _remember_message_id(self, message_id: int) -> None:
+        """Record a handled message ID, evicting the oldest beyond the cap."""
+        self._processed_message_ids[message_id] = None
+        self._processed_message_ids.move_to_end(message_id)
+        while len(self._processed_message_ids) > self.PROCESSED_MESSAGE_ID_LIMIT:
+            self._processed_message_ids.popitem(last=False)
+
+    @staticmethod
+    def _expire_entries[K](entries: OrderedDict[K, float], cutoff: float) -> int:
+        """Pop entries stamped before ``cutoff`` from the front of ``entries``.
+
+        Entries are moved to the end whenever they are refreshed, so the
+        front always holds the oldest timestamp.
+        """
+        removed = 0
+        while entries and next(iter(entries.values())) < cutoff:
+            entries.popitem(last=False)
+            removed += 1
+        return removed
+
     async def close(self) -> None:
         """Clean shutdown of the bot."""
         self.logger.info("Shutting down MTG Card bot")
 
-        # Cancel cleanup task
-        if self._cleanup_task and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._cleanup_task
+        # Cancel background tasks
+        tasks = list(self._bg_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         # Close HTTP clients
         try:
@@ -940,9 +1051,15 @@ class MTGCardBot(discord.Client):
         except Exception as e:
             self.logger.warning("Error closing scryfall client", error=str(e))
 
+        try:
+            await self.image_fetcher.aclose()
+        except Exception as e:
+            self.logger.warning("Error closing image client", error=str(e))
+
         # Clear duplicate suppression data
         self._recent_commands.clear()
         self._processed_message_ids.clear()
         self._user_rate_limits.clear()
+        self._card_cache.clear()
 
         await super().close()
@@ -1,8 +1,16 @@
 """Configuration management for the MTG Card Discord bot."""
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
+# One ``KEY=value`` assignment per line, with surrounding whitespace trimmed.
+# Blank lines, comment lines and lines without "=" don't match.
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
+
 
 def get_bool(key: str, default: bool = False) -> bool:
     """Get boolean environment variable with default."""
@@ -39,26 +47,16 @@ def load_env_file(env_file: Path) -> None:
     if not env_file.exists():
         return
 
-    with open(env_file) as f:
-        for line in f:
-            line = line.strip()
-            if line == "" or line.startswith("#"):
-                continue
-
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
+    for match in _ENV_LINE_RE.finditer(env_file.read_text()):
+        key, value = match.groups()
 
-                # Remove quotes if present
-                if (value.startswith('"') and value.endswith('"')) or (
-                    value.startswith("'") and value.endswith("'")
-                ):
-                    value = value[1:-1]
+        # Remove quotes if present
+        if value[:1] in ('"', "'") and value.endswith(value[0]):
+            value = value[1:-1]
 
-                # Only set if not already set by system environment
-                if not os.getenv(key):
-                    os.environ[key] = value
+        # Only set if not already set by system environment
+        if not os.getenv(key):
+            os.environ[key] = value
 
 
 class MTGConfig:
@@ -92,6 +90,11 @@ class MTGConfig:
             )
 
 
+@lru_cache(maxsize=1)
 def load_config() -> MTGConfig:
-    """Load configuration for MTG Card bot."""
+    """Load configuration for MTG Card bot.
+
+    The environment is read once per process; call ``load_config.cache_clear()``
+    to pick up later changes.
+    """
     return MTGConfig()
@@ -8,6 +8,7 @@ import httpx
 from PIL import Image, ImageDraw, ImageFont
 
 from . import logging
+from .cache import TTLCache
 from .scryfall import ScryfallClient
 
 if TYPE_CHECKING:
@@ -27,6 +28,13 @@ PLACEHOLDER_COLOR = (55, 57, 63)  # Slightly lighter than background
 PLACEHOLDER_TEXT_COLOR = (180, 180, 180)
 IMAGE_ACCEPT = "image/jpeg,image/png,image/*;q=0.8,*/*;q=0.5"
 
+# Connection pooling for the image CDN: keep connections warm between grid
+# requests so bursts of multi-card lookups reuse TLS sessions.
+IMAGE_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=40, keepalive_expiry=30.0
+)
+IMAGE_CLIENT_TIMEOUT = httpx.Timeout(connect=5.0, read=20.0, write=10.0, pool=10.0)
+
 
 def calculate_grid_layout(count: int) -> tuple[int, int]:
     """Return (columns, rows) for a given card count.
@@ -52,12 +60,19 @@ def calculate_grid_layout(count: int) -> tuple[int, int]:
     return (5, rows)
 
 
-async def _download_image(client: httpx.AsyncClient, url: str) -> Image.Image | None:
-    """Download a single card image. Returns None on failure."""
+async def _download_image(client: httpx.AsyncClient, url: str) -> bytes | None:
+    """Download a single card image's bytes. Returns None on failure."""
     try:
-        response = await client.get(url)
-        response.raise_for_status()
-        return Image.open(io.BytesIO(response.content)).convert("RGBA")
+        # Stream the body straight into one buffer rather than
+        # materializing response.content first
+        async with client.stream("GET", url) as response:
+            if not response.is_success:
+                await response.aread()
+                response.raise_for_status()
+            buffer = io.BytesIO()
+            async for chunk in response.aiter_bytes():
+                buffer.write(chunk)
+        return buffer.getvalue()
     except httpx.HTTPStatusError as exc:
         logger.warning(
             "Card image download failed",
@@ -71,6 +86,71 @@ async def _download_image(client: httpx.AsyncClient, url: str) -> Image.Image |
         return None
 
 
+def _decode_image(data: bytes, url: str) -> Image.Image | None:
+    """Decode downloaded image bytes. Returns None on failure."""
+    try:
+        return Image.open(io.BytesIO(data)).convert("RGBA")
+    except Exception as exc:
+        logger.warning("Card image decode failed", url=url, error=str(exc))
+        return None
+
+
+def create_image_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for downloading card images."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=IMAGE_CLIENT_LIMITS,
+        timeout=IMAGE_CLIENT_TIMEOUT,
+        follow_redirects=True,
+        headers={
+            "User-Agent": ScryfallClient.USER_AGENT,
+            "Accept": IMAGE_ACCEPT,
+        },
+    )
+
+
+class CardImageFetcher:
+    """Card image downloader with request coalescing and a short-lived cache.
+
+    Concurrent fetches of the same URL share one download, and recently
+    downloaded images are served from memory.
+    """
+
+    CACHE_SIZE = 64  # Roughly 5-6 MB of "normal" card images (~70-100 KB each)
+    CACHE_TTL = 300.0
+
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self.client = client or create_image_client()
+        self._cache: TTLCache[str, bytes] = TTLCache(self.CACHE_SIZE, self.CACHE_TTL)
+        self._inflight: dict[str, asyncio.Task[bytes | None]] = {}
+
+    async def fetch(self, url: str) -> bytes | None:
+        """Return the image bytes for ``url``, or None if the download failed."""
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._download(url))
+            self._inflight[url] = task
+        # Shield so one cancelled waiter does not cancel the shared download
+        return await asyncio.shield(task)
+
+    async def _download(self, url: str) -> bytes | None:
+        try:
+            data = await _download_image(self.client, url)
+        finally:
+            del self._inflight[url]
+        if data is not None:
+            self._cache.set(url, data)
+        return data
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
+
+
 def _make_rounded_mask(width: int, height: int, radius: int) -> Image.Image:
     """Create a rounded-rectangle alpha mask."""
     mask = Image.new("L", (width, height), 0)
@@ -118,34 +198,19 @@ def _apply_rounded_corners(img: Image.Image, radius: int) -> Image.Image:
     return output
 
 
-async def compose_card_grid(
-    cards: list["Card"],
+def _render_grid(
+    image_data: list[bytes | None], image_urls: list[str], card_names: list[str]
 ) -> io.BytesIO:
-    """Compose multiple card images into a single grid image.
+    """Decode card images and render the grid as PNG.
 
-    Downloads card images concurrently, arranges them in an adaptive grid
-    with rounded corners and dark background, and returns PNG bytes.
+    This is CPU-bound Pillow work and runs in a worker thread.
     """
-    if not cards:
-        raise ValueError("No cards to compose")
+    cols, rows = calculate_grid_layout(len(image_data))
 
-    cols, rows = calculate_grid_layout(len(cards))
-
-    # Download all images concurrently using a dedicated client
-    # (image CDN requests should not share the API client's connection pool)
-    image_urls = [
-        card.get_best_image_url(("normal", "large", "small")) for card in cards
+    raw_images = [
+        _decode_image(data, url) if data is not None else None
+        for data, url in zip(image_data, image_urls, strict=True)
     ]
-    async with httpx.AsyncClient(
-        timeout=15.0,
-        follow_redirects=True,
-        headers={
-            "User-Agent": ScryfallClient.USER_AGENT,
-            "Accept": IMAGE_ACCEPT,
-        },
-    ) as img_client:
-        download_tasks = [_download_image(img_client, url) for url in image_urls]
-        raw_images = await asyncio.gather(*download_tasks)
 
     if not any(image is not None for image in raw_images):
         raise RuntimeError("All card image downloads failed")
@@ -156,9 +221,7 @@ async def compose_card_grid(
         if raw is not None:
             card_images.append(_apply_rounded_corners(raw, CORNER_RADIUS))
         else:
-            placeholder = _make_placeholder(
-                CARD_WIDTH, CARD_HEIGHT, cards[i].get_display_name()
-            )
+            placeholder = _make_placeholder(CARD_WIDTH, CARD_HEIGHT, card_names[i])
             card_images.append(_apply_rounded_corners(placeholder, CORNER_RADIUS))
 
     # Calculate canvas dimensions
@@ -198,3 +261,39 @@ async def compose_card_grid(
     final.save(buffer, format="PNG", optimize=True)
     buffer.seek(0)
     return buffer
+
+
+async def compose_card_grid(
+    cards: list["Card"],
+    fetcher: CardImageFetcher | None = None,
+) -> io.BytesIO:
+    """Compose multiple card images into a single grid image.
+
+    Downloads card images concurrently, arranges them in an adaptive grid
+    with rounded corners and dark background, and returns PNG bytes.
+    Pass a long-lived ``fetcher`` to reuse pooled connections and cached
+    images across grids; otherwise a temporary fetcher is created.
+    """
+    if not cards:
+        raise ValueError("No cards to compose")
+
+    # Download all images concurrently using a dedicated client
+    # (image CDN requests should not share the API client's connection pool)
+    image_urls = [
+        card.get_best_image_url(("normal", "large", "small")) for card in cards
+    ]
+    if fetcher is None:
+        temp_fetcher = CardImageFetcher()
+        try:
+            image_data = await asyncio.gather(
+                *[temp_fetcher.fetch(url) for url in image_urls]
+            )
+        finally:
+            await temp_fetcher.aclose()
+    else:
+        image_data = await asyncio.gather(*[fetcher.fetch(url) for url in image_urls])
+
+    # Decoding, compositing, and PNG encoding would otherwise block the
+    # event loop (and every other Discord message) for the whole render
+    card_names = [card.get_display_name() for card in cards]
+    return await asyncio.to_thread(_render_grid, image_data, image_urls, card_names)
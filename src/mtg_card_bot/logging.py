@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 _LOGGING_INITIALIZED = False
 
 
@@ -35,8 +37,11 @@ class Logger:
 
     def _log(self, level: int, message: str, **kwargs: Any) -> None:
         """Emit a structured log message with optional key/value context."""
+        # Skip formatting entirely for records the level would drop anyway
+        if not self.logger.isEnabledFor(level):
+            return
         if kwargs:
-            context = " ".join(f"{key}={value}" for key, value in kwargs.items())
+            context = " ".join([f"{key}={value}" for key, value in kwargs.items()])
             message = f"{message} {context}"
         self.logger.log(level, message)
 
@@ -70,7 +75,7 @@ def initialize_logger(level: str = "info", json_format: bool = False) -> None:
                     "logger": record.name,
                     "message": record.getMessage(),
                 }
-                return json.dumps(payload)
+                return orjson.dumps(payload).decode()
 
         handler = logging.StreamHandler(sys.stdout)
         handler.setFormatter(JsonFormatter())
@@ -84,6 +89,7 @@ def initialize_logger(level: str = "info", json_format: bool = False) -> None:
     _LOGGING_INITIALIZED = True
 
 
+@lru_cache(maxsize=32)
 def with_component(component: str) -> Logger:
-    """Return a logger with a component field."""
+    """Return the shared logger for a component."""
     return Logger(component)
@@ -2,61 +2,185 @@
 
 import asyncio
 import random
+import sys
 import time
-from typing import Any
-from urllib.parse import quote, urlencode
+from collections.abc import Sequence
+from functools import cached_property
+from typing import Any, overload
+from urllib.parse import quote, quote_plus, urlencode
 
 import httpx
+import orjson
 
 from . import errors, logging
 
+_loads = orjson.loads
+
+# Image formats tried in order when no preference is given, highest quality first
+_DEFAULT_IMAGE_ORDER = ("png", "large", "normal", "small")
+
+# Format display order and names for legality summaries
+_FORMAT_NAMES: tuple[tuple[str, str], ...] = (
+    ("standard", "Standard"),
+    ("pioneer", "Pioneer"),
+    ("modern", "Modern"),
+    ("legacy", "Legacy"),
+    ("vintage", "Vintage"),
+    ("commander", "Commander"),
+    ("oathbreaker", "Oathbreaker"),
+    ("brawl", "Brawl"),
+    ("historic", "Historic"),
+    ("pauper", "Pauper"),
+    ("penny", "Penny"),
+    ("duel", "Duel"),
+)
+
+# Price keys tried in order (USD, then foil, then EUR, then MTGO tickets),
+# with the prefix and suffix used to display each
+_PRICE_PREFS: tuple[tuple[str, str, str], ...] = (
+    ("usd", "$", ""),
+    ("usd_foil", "$", " (foil)"),
+    ("eur", "€", ""),
+    ("tix", "", " tix"),
+)
+
 
 class Card:
     """Represents a Magic: The Gathering card from the Scryfall API."""
 
     def __init__(self, data: dict[str, Any]) -> None:
-        self.object = data.get("object", "")
-        self.id = data.get("id", "")
-        self.oracle_id = data.get("oracle_id", "")
-        self.name = data.get("name", "")
-        self.lang = data.get("lang", "")
-        self.released_at = data.get("released_at", "")
-        self.uri = data.get("uri", "")
-        self.scryfall_uri = data.get("scryfall_uri", "")
-        self.layout = data.get("layout", "")
-        self.image_uris = data.get("image_uris", {})
-        self.card_faces = [CardFace(face) for face in data.get("card_faces", [])]
-        self.mana_cost = data.get("mana_cost", "")
-        self.cmc = data.get("cmc", 0)
-        self.type_line = data.get("type_line", "")
-        self.oracle_text = data.get("oracle_text", "")
-        self.colors = data.get("colors", [])
-        self.set_name = data.get("set_name", "")
-        self.set_code = data.get("set", "")
-        self.rarity = data.get("rarity", "")
-        self.artist = data.get("artist", "")
-        self.prices = data.get("prices", {})
-        self.legalities = data.get("legalities", {})
-        self.image_status = data.get("image_status", "")
-        self.highres_image = data.get("highres_image", False)
+        # Fields are read from the raw payload on first access, so wrapping a
+        # full search page only costs one attribute store per card. Short
+        # codes that repeat across cards (set, rarity, legalities, ...) are
+        # interned back into the payload when first read, so cards that are
+        # kept around share one copy of each string.
+        self._data = data
+
+    def _interned(self, key: str) -> str:
+        """Return a payload string, interning it in the payload if present."""
+        value = self._data.get(key)
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            value = self._data[key] = sys.intern(value)
+        return value
+
+    @cached_property
+    def object(self) -> str:
+        return self._data.get("object", "")
+
+    @cached_property
+    def id(self) -> str:
+        return self._data.get("id", "")
+
+    @cached_property
+    def oracle_id(self) -> str:
+        return self._data.get("oracle_id", "")
+
+    @cached_property
+    def name(self) -> str:
+        return self._data.get("name", "")
+
+    @cached_property
+    def lang(self) -> str:
+        return self._interned("lang")
+
+    @cached_property
+    def released_at(self) -> str:
+        return self._data.get("released_at", "")
+
+    @cached_property
+    def uri(self) -> str:
+        return self._data.get("uri", "")
+
+    @cached_property
+    def scryfall_uri(self) -> str:
+        return self._data.get("scryfall_uri", "")
+
+    @cached_property
+    def layout(self) -> str:
+        return self._interned("layout")
+
+    @cached_property
+    def image_uris(self) -> dict[str, str]:
+        return self._data.get("image_uris", {})
+
+    @cached_property
+    def card_faces(self) -> "CardFaces":
+        return CardFaces(self._data.get("card_faces", []))
+
+    @cached_property
+    def mana_cost(self) -> str:
+        return self._data.get("mana_cost", "")
+
+    @cached_property
+    def cmc(self) -> float:
+        return self._data.get("cmc", 0)
+
+    @cached_property
+    def type_line(self) -> str:
+        return self._data.get("type_line", "")
+
+    @cached_property
+    def oracle_text(self) -> str:
+        return self._data.get("oracle_text", "")
+
+    @cached_property
+    def colors(self) -> list[str]:
+        return self._data.get("colors", [])
+
+    @cached_property
+    def set_name(self) -> str:
+        return self._data.get("set_name", "")
+
+    @cached_property
+    def set_code(self) -> str:
+        return self._interned("set")
+
+    @cached_property
+    def rarity(self) -> str:
+        return self._interned("rarity")
+
+    @cached_property
+    def artist(self) -> str:
+        return self._data.get("artist", "")
+
+    @cached_property
+    def prices(self) -> dict[str, str | None]:
+        return self._data.get("prices", {})
+
+    @cached_property
+    def legalities(self) -> dict[str, str]:
+        legalities = self._data.get("legalities", {})
+        for fmt, status in legalities.items():
+            if isinstance(status, str):
+                legalities[fmt] = sys.intern(status)
+        return legalities
+
+    @cached_property
+    def image_status(self) -> str:
+        return self._interned("image_status")
+
+    @cached_property
+    def highres_image(self) -> bool:
+        return self._data.get("highres_image", False)
 
     def get_best_image_url(self, prefer_formats: tuple[str, ...] | None = None) -> str:
         """Get the highest quality image URL available for the card."""
         image_uris = self.image_uris
 
         # For double-faced cards, prefer the first face
-        if self.card_faces and self.card_faces[0].image_uris:
-            image_uris = self.card_faces[0].image_uris
+        faces = self.card_faces
+        if faces and faces[0].image_uris:
+            image_uris = faces[0].image_uris
 
         if not image_uris:
             return ""
 
-        # Prefer highest quality images in order
-        image_preference = prefer_formats or ("png", "large", "normal", "small")
-
-        for format_type in image_preference:
-            if format_type in image_uris:
-                return image_uris[format_type]
+        for format_type in prefer_formats or _DEFAULT_IMAGE_ORDER:
+            url = image_uris.get(format_type)
+            if url is not None:
+                return url
 
         # Return any available image if none of the preferred formats exist
         return next(iter(image_uris.values()), "")
@@ -83,46 +207,18 @@ class Card:
 
     def get_price_display(self) -> str:
         """Get a formatted price string for display."""
-        if not self.prices:
+        prices = self.prices
+        if not prices:
             return ""
 
-        # Prioritize USD prices
-        usd_price = self.prices.get("usd")
-        usd_foil_price = self.prices.get("usd_foil")
-
-        if usd_price:
-            try:
-                # Convert to float and format as currency
-                price_float = float(usd_price)
-                return f"${price_float:.2f}"
-            except (ValueError, TypeError):
-                pass
-
-        if usd_foil_price:
-            try:
-                # Convert to float and format as currency
-                price_float = float(usd_foil_price)
-                return f"${price_float:.2f} (foil)"
-            except (ValueError, TypeError):
-                pass
-
-        # Fallback to EUR if USD not available
-        eur_price = self.prices.get("eur")
-        if eur_price:
-            try:
-                price_float = float(eur_price)
-                return f"€{price_float:.2f}"
-            except (ValueError, TypeError):
-                pass
-
-        # Fallback to MTGO tickets
-        tix_price = self.prices.get("tix")
-        if tix_price:
+        for key, prefix, suffix in _PRICE_PREFS:
+            price = prices.get(key)
+            if not price:
+                continue
             try:
-                price_float = float(tix_price)
-                return f"{price_float:.2f} tix"
+                return f"{prefix}{float(price):.2f}{suffix}"
             except (ValueError, TypeError):
-                pass
+                continue
 
         return ""
 
@@ -131,26 +227,10 @@ class Card:
         if not self.legalities:
             return ""
 
-        # Define format display order and names
-        format_names = {
-            "standard": "Standard",
-            "pioneer": "Pioneer",
-            "modern": "Modern",
-            "legacy": "Legacy",
-            "vintage": "Vintage",
-            "commander": "Commander",
-            "oathbreaker": "Oathbreaker",
-            "brawl": "Brawl",
-            "historic": "Historic",
-            "pauper": "Pauper",
-            "penny": "Penny",
-            "duel": "Duel",
-        }
-
-        legal_formats = []
-        for format_key, format_name in format_names.items():
-            if self.legalities.get(format_key) == "legal":
-                legal_formats.append(format_name)
+        legalities = self.legalities
+        legal_formats = [
+            name for key, name in _FORMAT_NAMES if legalities.get(key) == "legal"
+        ]
 
         if not legal_formats:
             return "Not legal in any major formats"
@@ -172,6 +252,32 @@ class CardFace:
         self.image_uris = data.get("image_uris", {})
 
 
+class CardFaces(Sequence[CardFace]):
+    """Read-only view over a card's raw faces, wrapping each on first access."""
+
+    def __init__(self, data: list[dict[str, Any]]) -> None:
+        self._data = data
+        self._faces: list[CardFace | None] = [None] * len(data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> CardFace: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CardFace]: ...
+
+    def __getitem__(self, index: int | slice) -> CardFace | list[CardFace]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        face = self._faces[index]
+        if face is None:
+            face = self._faces[index] = CardFace(self._data[index])
+        return face
+
+
 class SearchResult:
     """Represents the result of a card search query."""
 
@@ -187,14 +293,29 @@ class ScryfallError(Exception):
     """Error response from the Scryfall API."""
 
     def __init__(self, data: dict[str, Any]) -> None:
-        self.object = data.get("object", "")
-        self.code = data.get("code", "")
+        # Only status and details are read on the error path; the remaining
+        # fields are looked up from the payload if anything asks for them.
+        self._data = data
         self.status = data.get("status", 0)
         self.details = data.get("details", "")
-        self.type = data.get("type", "")
-        self.warnings = data.get("warnings", [])
         super().__init__(f"Scryfall API error: {self.details} (status: {self.status})")
 
+    @property
+    def object(self) -> str:
+        return self._data.get("object", "")
+
+    @property
+    def code(self) -> str:
+        return self._data.get("code", "")
+
+    @property
+    def type(self) -> str:
+        return self._data.get("type", "")
+
+    @property
+    def warnings(self) -> list[str]:
+        return self._data.get("warnings", [])
+
     def get_error_type(self) -> errors.ErrorType:
         """Return the error type for metrics tracking."""
         if self.status == 404:
@@ -212,9 +333,15 @@ class ScryfallClient:
     RATE_LIMIT = 0.075  # 75ms between requests
     MAX_RETRIES = 2
     RETRY_BACKOFF = 0.5  # Base delay in seconds; doubles each retry
+    # Keep idle connections around between commands so lookups reuse them
+    CONNECTION_LIMITS = httpx.Limits(
+        max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+    )
 
     def __init__(self) -> None:
         self.client = httpx.AsyncClient(
+            http2=True,
+            limits=self.CONNECTION_LIMITS,
             timeout=15.0,
             follow_redirects=True,
             headers={
@@ -223,8 +350,7 @@ class ScryfallClient:
             },
         )
         self.logger = logging.with_component("scryfall")
-        self._last_request_time = 0.0
-        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -234,23 +360,29 @@ class ScryfallClient:
         """Check if an HTTP status code indicates a retryable error."""
         return status_code in (429, 500, 502, 503, 504)
 
+    def _reserve_request_slot(self) -> float:
+        """Claim the next free request slot and return seconds to wait for it.
+
+        The slot is reserved before the caller sleeps, so concurrent callers
+        queue up behind each other. This never yields, so no lock is needed.
+        """
+        now = time.monotonic()
+        slot = max(self._next_request_at, now)
+        self._next_request_at = slot + self.RATE_LIMIT
+        return slot - now
+
     async def _request(self, endpoint: str) -> httpx.Response:
         """Make a rate-limited request to the Scryfall API with retries."""
         url = f"{self.BASE_URL}{endpoint}"
         last_exception: Exception | None = None
 
         for attempt in range(self.MAX_RETRIES):
-            # Rate limiting — compute elapsed time *inside* the lock so
-            # queued coroutines don't use a stale timestamp that would
-            # inflate the sleep duration.
-            async with self._rate_lock:
-                now = time.time()
-                time_since_last = now - self._last_request_time
-                if time_since_last < self.RATE_LIMIT:
-                    await asyncio.sleep(self.RATE_LIMIT - time_since_last)
-                self._last_request_time = time.time()
-
-            start_time = time.time()
+            # Rate limiting
+            delay = self._reserve_request_slot()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            start_time = time.monotonic()
 
             if attempt > 0:
                 self.logger.debug(
@@ -261,7 +393,7 @@ class ScryfallClient:
 
             try:
                 response = await self.client.get(url)
-                response_time = (time.time() - start_time) * 1000
+                response_time = (time.monotonic() - start_time) * 1000
 
                 if response.status_code >= 400:
                     # Retry on transient server errors
@@ -286,9 +418,9 @@ class ScryfallClient:
                         raise last_exception
 
                     try:
-                        error_data = response.json()
+                        error_data = _loads(response.content)
                         raise ScryfallError(error_data)
-                    except ValueError:
+                    except orjson.JSONDecodeError:
                         error = errors.create_error(
                             errors.ErrorType.API,
                             f"HTTP error {response.status_code}",
@@ -351,7 +483,7 @@ class ScryfallClient:
         endpoint = f"/cards/named?fuzzy={quote(name)}"
 
         response = await self._request(endpoint)
-        data = response.json()
+        data = _loads(response.content)
         card = Card(data)
 
         self.logger.debug("Successfully retrieved card", card_name=card.name)
@@ -368,7 +500,7 @@ class ScryfallClient:
         endpoint = f"/cards/named?exact={quote(name)}"
 
         response = await self._request(endpoint)
-        data = response.json()
+        data = _loads(response.content)
         card = Card(data)
 
         self.logger.debug(
@@ -383,6 +515,10 @@ class ScryfallClient:
         direction: str | None = None,
         page: int | None = None,
     ) -> str:
+        # Plain searches are the common case; skip the generic encoder for them
+        if order is None and direction is None and page is None:
+            return f"/cards/search?q={quote_plus(query)}"
+
         params: dict[str, str] = {"q": query}
         if order:
             params["order"] = order
@@ -398,17 +534,14 @@ class ScryfallClient:
         """Get a random Magic card, optionally filtered by search query."""
         if query:
             self.logger.debug("Fetching filtered random card", query=query)
-            params = urlencode({"q": query})
-            endpoint = f"/cards/random?{params}"
-            response = await self._request(endpoint)
-            data = response.json()
-            card = Card(data)
+            endpoint = f"/cards/random?q={quote_plus(query)}"
         else:
             self.logger.debug("Fetching random card")
             endpoint = "/cards/random"
-            response = await self._request(endpoint)
-            data = response.json()
-            card = Card(data)
+
+        response = await self._request(endpoint)
+        data = _loads(response.content)
+        card = Card(data)
 
         self.logger.debug("Successfully retrieved random card", card_name=card.name)
         return card
@@ -436,7 +569,7 @@ class ScryfallClient:
         endpoint = self._build_search_endpoint(query, order, direction, page)
 
         response = await self._request(endpoint)
-        data = response.json()
+        data = _loads(response.content)
         result = SearchResult(data)
 
         self.logger.debug(
@@ -495,7 +628,7 @@ class ScryfallClient:
         endpoint = f"/cards/{card_id}/rulings"
 
         response = await self._request(endpoint)
-        data = response.json()
+        data = _loads(response.content)
 
         # Return the data array from the rulings response
         rulings = data.get("data", [])
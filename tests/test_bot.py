@@ -1,6 +1,10 @@
+import asyncio
+import io
+from collections import OrderedDict
 from collections.abc import AsyncIterator
+from types import SimpleNamespace
 from typing import Any, cast
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import discord
 import pytest
@@ -111,6 +115,75 @@ async def test_on_message_routes_bracket_lookup(
     lookup.assert_awaited_once_with(message, "Lightning Bolt")
 
 
+async def test_on_message_ignores_plain_chat_without_parsing(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    extract = Mock(return_value=None)
+    lookup = AsyncMock()
+    monkeypatch.setattr(bot, "_extract_bracket_content", extract)
+    monkeypatch.setattr(bot, "_handle_card_lookup", lookup)
+    message = FakeMessage("just chatting about lightning bolt", message_id=104)
+
+    await bot.on_message(cast(Any, message))
+
+    extract.assert_not_called()
+    lookup.assert_not_awaited()
+    assert message.id not in bot._processed_message_ids
+
+
+async def test_on_message_suppresses_duplicate_commands(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bot.config.command_cooldown = 0
+    lookup = AsyncMock()
+    monkeypatch.setattr(bot, "_handle_card_lookup", lookup)
+
+    await bot.on_message(cast(Any, FakeMessage("!Lightning  Bolt", message_id=105)))
+    await bot.on_message(cast(Any, FakeMessage("!lightning bolt", message_id=106)))
+    await bot.on_message(cast(Any, FakeMessage("!counterspell", message_id=107)))
+
+    assert lookup.await_count == 2
+
+
+async def test_on_message_rate_limits_per_user(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lookup = AsyncMock()
+    monkeypatch.setattr(bot, "_handle_card_lookup", lookup)
+    # Right after boot the monotonic clock can be below the cooldown
+    monkeypatch.setattr("mtg_card_bot.bot.time", SimpleNamespace(monotonic=lambda: 1.0))
+
+    await bot.on_message(cast(Any, FakeMessage("!bolt", message_id=108)))
+    await bot.on_message(cast(Any, FakeMessage("!counterspell", message_id=109)))
+    await bot.on_message(
+        cast(Any, FakeMessage("!counterspell", message_id=110, author=FakeAuthor(2)))
+    )
+
+    assert [call.args[1] for call in lookup.await_args_list] == [
+        "bolt",
+        "counterspell",
+    ]
+
+
+async def test_on_message_ignores_redelivered_rate_limited_message(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lookup = AsyncMock()
+    monkeypatch.setattr(bot, "_handle_card_lookup", lookup)
+    clock = SimpleNamespace(monotonic=lambda: 100.0)
+    monkeypatch.setattr("mtg_card_bot.bot.time", clock)
+
+    await bot.on_message(cast(Any, FakeMessage("!bolt", message_id=111)))
+    rate_limited = FakeMessage("!counterspell", message_id=112)
+    await bot.on_message(cast(Any, rate_limited))
+
+    # Discord redelivers the rate-limited message after the cooldown
+    clock.monotonic = lambda: 200.0
+    await bot.on_message(cast(Any, rate_limited))
+
+    assert [call.args[1] for call in lookup.await_args_list] == ["bolt"]
+
+
 async def test_on_message_routes_random_alias_with_filters(
     bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -123,6 +196,20 @@ async def test_on_message_routes_random_alias_with_filters(
     random_lookup.assert_awaited_once_with(message, "rarity:mythic e:mh3")
 
 
+async def test_on_message_rules_without_card_name_reports_error(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rules_lookup = AsyncMock()
+    monkeypatch.setattr(bot, "_handle_rules_lookup", rules_lookup)
+    channel = FakeChannel()
+
+    await bot.on_message(cast(Any, FakeMessage("!rules", channel=channel)))
+
+    rules_lookup.assert_not_awaited()
+    embed = channel.sent_messages[0]["embed"]
+    assert embed.description == "Please provide a card name for rules lookup."
+
+
 async def test_on_message_routes_multi_lookup(
     bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -135,6 +222,17 @@ async def test_on_message_routes_multi_lookup(
     multi_lookup.assert_awaited_once_with(message, "bolt; counterspell; doom blade")
 
 
+async def test_help_command_sends_prebuilt_embed(bot: MTGCardBot) -> None:
+    channel = FakeChannel()
+
+    await bot.on_message(cast(Any, FakeMessage("!help", channel=channel)))
+
+    assert len(channel.sent_messages) == 1
+    embed = channel.sent_messages[0]["embed"]
+    assert embed is bot._help_embed
+    assert "`!rules counterspell`" in _field_map(embed)["Essential Commands"]
+
+
 async def test_resolve_card_query_uses_search_and_fallback_for_filtered_queries(
     bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -159,6 +257,40 @@ async def test_resolve_card_query_uses_search_and_fallback_for_filtered_queries(
     get_by_name.assert_awaited_once_with("sol ring")
 
 
+async def test_rules_lookup_lists_and_truncates_rulings(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    card = make_card()
+    rulings = [
+        {"source": "wotc", "published_at": "2004-10-04", "comment": "x" * 2000},
+        *[
+            {"source": "scryfall", "published_at": "2020-01-01", "comment": "ok"}
+            for _ in range(11)
+        ],
+    ]
+    monkeypatch.setattr(
+        bot, "_resolve_card_query", AsyncMock(return_value=(card, False))
+    )
+    monkeypatch.setattr(
+        bot.scryfall_client, "get_card_rulings", AsyncMock(return_value=rulings)
+    )
+    channel = FakeChannel()
+
+    await bot._handle_rules_lookup(
+        cast(Any, FakeMessage("!rules bolt", channel=channel)), "bolt"
+    )
+
+    embed = channel.sent_messages[0]["embed"]
+    assert embed.title == "Rulings for Lightning Bolt"
+    assert len(embed.fields) == 10
+    assert embed.fields[0].name == "Wizards (2004-10-04)"
+    assert embed.fields[0].value == "x" * 1021 + "..."
+    assert embed.fields[1].name == "Scryfall (2020-01-01)"
+    assert embed.footer.text == (
+        "Showing 10 of 12 rulings. Visit Scryfall for complete rulings."
+    )
+
+
 async def test_send_card_message_without_image_uses_text_embed(bot: MTGCardBot) -> None:
     channel = FakeChannel()
     card = make_card(image_uris={})
@@ -207,6 +339,18 @@ async def test_send_card_message_with_image_includes_filter_context(
     assert embed.footer.text == "Limited Edition Alpha • Rare • Art by Christopher Rush"
 
 
+async def test_multi_card_lookup_with_stray_semicolon_uses_single_lookup(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lookup = AsyncMock()
+    monkeypatch.setattr(bot, "_handle_card_lookup", lookup)
+    message = FakeMessage("!bolt; ")
+
+    await bot._handle_multi_card_lookup(cast(Any, message), "bolt;  ; ")
+
+    lookup.assert_awaited_once_with(message, "bolt")
+
+
 async def test_multi_card_sends_grid_embed_with_file(
     bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -229,8 +373,6 @@ async def test_multi_card_sends_grid_embed_with_file(
 
     monkeypatch.setattr(bot, "_resolve_card_query", fake_resolve)
 
-    import io
-
     fake_buffer = io.BytesIO(b"fake-png-data")
     compose = AsyncMock(return_value=fake_buffer)
     monkeypatch.setattr("mtg_card_bot.bot.compose_card_grid", compose)
@@ -240,7 +382,7 @@ async def test_multi_card_sends_grid_embed_with_file(
 
     await bot.on_message(cast(Any, message))
 
-    compose.assert_awaited_once_with([bolt, counterspell])
+    compose.assert_awaited_once_with([bolt, counterspell], bot.image_fetcher)
 
     # Should send one message with embed + file
     assert len(channel.sent_messages) == 1
@@ -264,3 +406,131 @@ async def test_multi_card_sends_grid_embed_with_file(
 
     # Grid image attached
     assert embed.image.url == "attachment://cards.png"
+
+
+async def test_multi_card_lookup_bounds_concurrent_resolution(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(bot, "MULTI_LOOKUP_CONCURRENCY", 2)
+    active = 0
+    peak = 0
+
+    async def fake_resolve(query: str) -> tuple[Card, bool]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return make_card(name=query), False
+
+    monkeypatch.setattr(bot, "_resolve_card_query", fake_resolve)
+    monkeypatch.setattr(
+        "mtg_card_bot.bot.compose_card_grid",
+        AsyncMock(return_value=io.BytesIO(b"fake-png-data")),
+    )
+
+    channel = FakeChannel()
+    message = FakeMessage("!a; b; c; d; e", message_id=300, channel=channel)
+
+    await bot.on_message(cast(Any, message))
+
+    assert peak == 2
+    assert len(channel.sent_messages) == 1
+
+
+def test_expire_entries_pops_only_expired_front(bot: MTGCardBot) -> None:
+    entries = OrderedDict(stale=10.0, refreshed=20.0, fresh=40.0)
+    entries["refreshed"] = 50.0
+    entries.move_to_end("refreshed")
+
+    removed = bot._expire_entries(entries, cutoff=30.0)
+
+    assert removed == 1
+    assert list(entries.items()) == [("fresh", 40.0), ("refreshed", 50.0)]
+
+
+def test_next_cleanup_delay_tracks_oldest_entry(bot: MTGCardBot) -> None:
+    assert bot._next_cleanup_delay(now=1000.0) is None
+
+    bot._user_rate_limits[1] = 900.0
+    bot._recent_commands[(1, b"digest")] = 950.0
+
+    # Oldest stamp (900) expires at 1200; the minimum spacing applies after
+    assert bot._next_cleanup_delay(now=1000.0) == 200.0
+    assert bot._next_cleanup_delay(now=1180.0) == bot.CLEANUP_MIN_INTERVAL
+
+
+async def test_on_message_wakes_cleanup_task(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(bot, "_handle_card_lookup", AsyncMock())
+    assert not bot._cleanup_wakeup.is_set()
+
+    await bot.on_message(cast(Any, FakeMessage("!bolt", message_id=120)))
+
+    assert bot._cleanup_wakeup.is_set()
+
+
+async def test_close_cancels_background_tasks(bot: MTGCardBot) -> None:
+    await bot.setup_hook()
+    (cleanup_task,) = bot._bg_tasks
+
+    await bot.close()
+
+    assert cleanup_task.done()
+    assert not bot._bg_tasks
+
+
+def test_processed_message_ids_are_capped(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(bot, "PROCESSED_MESSAGE_ID_LIMIT", 3)
+
+    for message_id in range(1, 6):
+        bot._remember_message_id(message_id)
+
+    assert list(bot._processed_message_ids) == [3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("lightning bolt", False),
+        ("sol ring e:lea", True),
+        ("Goblin T:creature", True),
+        ("Jace, the Mind Sculptor", False),
+        ("tarmogoyf is:FOIL", True),
+    ],
+)
+def test_has_filter_parameters(bot: MTGCardBot, query: str, expected: bool) -> None:
+    assert bot._has_filter_parameters(query) is expected
+
+
+def test_extract_card_name_skips_filters_and_keywords(bot: MTGCardBot) -> None:
+    assert bot._extract_card_name("Sol Ring e:lea Foil borderless") == "Sol Ring"
+
+
+async def test_resolve_card_query_caches_name_lookups(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected_card = make_card()
+    get_by_name = AsyncMock(return_value=expected_card)
+    monkeypatch.setattr(bot.scryfall_client, "get_card_by_name", get_by_name)
+
+    first = await bot._resolve_card_query("Lightning Bolt")
+    second = await bot._resolve_card_query("  lightning   bolt ")
+
+    assert first == second == (expected_card, False)
+    get_by_name.assert_awaited_once_with("Lightning Bolt")
+
+
+async def test_resolve_card_query_does_not_cache_unsorted_searches(
+    bot: MTGCardBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    search_first = AsyncMock(return_value=make_card(name="Sol Ring"))
+    monkeypatch.setattr(bot.scryfall_client, "search_card_first", search_first)
+
+    await bot._resolve_card_query("sol ring e:lea")
+    await bot._resolve_card_query("sol ring e:lea")
+
+    assert search_first.await_count == 2
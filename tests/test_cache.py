@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+import pytest
+
+from mtg_card_bot import cache
+from mtg_card_bot.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=fake))
+    return fake
+
+
+def test_get_returns_value_until_ttl_expires(clock: FakeClock) -> None:
+    entries: TTLCache[str, int] = TTLCache(max_size=4, ttl=10.0)
+    entries.set("bolt", 1)
+
+    clock.now += 9.9
+    assert entries.get("bolt") == 1
+
+    clock.now += 0.1
+    assert entries.get("bolt") is None
+    assert len(entries) == 0
+
+
+def test_set_evicts_least_recently_used(clock: FakeClock) -> None:
+    entries: TTLCache[str, int] = TTLCache(max_size=2, ttl=10.0)
+    entries.set("bolt", 1)
+    entries.set("counterspell", 2)
+
+    # Touch "bolt" so "counterspell" becomes the eviction candidate
+    assert entries.get("bolt") == 1
+    entries.set("sol ring", 3)
+
+    assert entries.get("counterspell") is None
+    assert entries.get("bolt") == 1
+    assert entries.get("sol ring") == 3
@@ -1,8 +1,9 @@
+import os
 from pathlib import Path
 
 import pytest
 
-from mtg_card_bot.config import MTGConfig, load_env_file
+from mtg_card_bot.config import MTGConfig, load_config, load_env_file
 
 
 def test_load_env_file_and_config_defaults(
@@ -53,3 +54,50 @@ def test_validate_config_rejects_invalid_log_level(
 
     with pytest.raises(ValueError, match="Invalid log level"):
         cfg.validate_config()
+
+
+def test_load_env_file_skips_comments_and_keeps_existing_values(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    for key in ["MTG_ENV_QUOTED", "MTG_ENV_SPACED", "MTG_ENV_HASH", "MTG_ENV_SET"]:
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setenv("MTG_ENV_SET", "from-system")
+
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "\n".join(
+            [
+                "# MTG_ENV_COMMENTED=ignored",
+                "",
+                "not an assignment",
+                "MTG_ENV_QUOTED='single quoted'",
+                '  MTG_ENV_SPACED  =  "spaced value"  ',
+                "MTG_ENV_HASH=value # kept verbatim",
+                "MTG_ENV_SET=from-file",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    load_env_file(env_file)
+
+    assert "MTG_ENV_COMMENTED" not in os.environ
+    assert os.environ["MTG_ENV_QUOTED"] == "single quoted"
+    assert os.environ["MTG_ENV_SPACED"] == "spaced value"
+    assert os.environ["MTG_ENV_HASH"] == "value # kept verbatim"
+    assert os.environ["MTG_ENV_SET"] == "from-system"
+
+
+def test_load_config_is_shared_until_cache_cleared(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    load_config.cache_clear()
+    monkeypatch.setenv("MTG_COMMAND_PREFIX", "?")
+    first = load_config()
+    monkeypatch.setenv("MTG_COMMAND_PREFIX", "$")
+
+    assert load_config() is first
+
+    load_config.cache_clear()
+    assert load_config().command_prefix == "$"
+    load_config.cache_clear()
@@ -1,3 +1,4 @@
+import asyncio
 import io
 from collections.abc import Callable
 from typing import Any, cast
@@ -12,6 +13,7 @@ from mtg_card_bot.grid import (
     CARD_WIDTH,
     IMAGE_ACCEPT,
     PADDING,
+    CardImageFetcher,
     calculate_grid_layout,
     compose_card_grid,
 )
@@ -125,7 +127,10 @@ class TestGridComposition:
                 return httpx.Response(500, text="Server Error")
             return httpx.Response(200, content=test_image_bytes)
 
-        cards = [_make_fake_card(name=f"Card {i}") for i in range(3)]
+        cards = [
+            _make_fake_card(name=f"Card {i}", image_url=f"https://img.example/{i}.png")
+            for i in range(3)
+        ]
 
         with _mock_httpx_client(handler):
             result = await compose_card_grid(cards)
@@ -147,3 +152,85 @@ class TestGridComposition:
             pytest.raises(RuntimeError, match="All card image downloads failed"),
         ):
             await compose_card_grid(cards)
+
+    async def test_compose_reuses_supplied_client(self) -> None:
+        test_image_bytes = _make_test_card_image()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=test_image_bytes)
+
+        cards = [_make_fake_card(name=f"Card {i}") for i in range(2)]
+
+        async with AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            result = await compose_card_grid(cards, CardImageFetcher(client))
+
+            # The caller owns the fetcher; composing must not close its client
+            assert not client.is_closed
+
+        img = Image.open(result)
+        assert img.format == "PNG"
+
+    async def test_compose_downloads_images_concurrently(self) -> None:
+        test_image_bytes = _make_test_card_image()
+        card_count = 4
+        started = 0
+        all_started = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal started
+            started += 1
+            if started == card_count:
+                all_started.set()
+            # Sequential downloads would never see every request in flight
+            await asyncio.wait_for(all_started.wait(), timeout=1.0)
+            return httpx.Response(200, content=test_image_bytes)
+
+        cards = [
+            _make_fake_card(name=f"Card {i}", image_url=f"https://img.example/{i}.png")
+            for i in range(card_count)
+        ]
+
+        async with AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            result = await compose_card_grid(cards, CardImageFetcher(client))
+
+        assert started == card_count
+        assert Image.open(result).format == "PNG"
+
+
+class TestCardImageFetcher:
+    async def test_coalesces_and_caches_identical_urls(self) -> None:
+        test_image_bytes = _make_test_card_image()
+        requested: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            await asyncio.sleep(0)
+            return httpx.Response(200, content=test_image_bytes)
+
+        async with AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            fetcher = CardImageFetcher(client)
+            url = "https://img.example/bolt.png"
+
+            results = await asyncio.gather(*[fetcher.fetch(url) for _ in range(3)])
+            assert requested == [url]
+            assert results == [test_image_bytes] * 3
+
+            # A later grid is served from the cache
+            assert await fetcher.fetch(url) == test_image_bytes
+            assert requested == [url]
+
+    async def test_failed_downloads_are_not_cached(self) -> None:
+        call_count = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal call_count
+            call_count += 1
+            return httpx.Response(503, text="Service Unavailable")
+
+        async with AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            fetcher = CardImageFetcher(client)
+
+            assert await fetcher.fetch("https://img.example/bolt.png") is None
+            assert await fetcher.fetch("https://img.example/bolt.png") is None
+
+        assert call_count == 2
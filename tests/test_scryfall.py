@@ -1,8 +1,13 @@
+import asyncio
+from types import SimpleNamespace
+from urllib.parse import urlencode
+
 import httpx
+import orjson
 import pytest
 
 from mtg_card_bot import errors
-from mtg_card_bot.scryfall import ScryfallClient
+from mtg_card_bot.scryfall import Card, ScryfallClient, ScryfallError
 
 
 async def _make_mock_client(handler):
@@ -176,3 +181,185 @@ async def test_request_does_not_retry_404() -> None:
 
     assert exc_info.value.error_type is errors.ErrorType.NOT_FOUND
     assert call_count == 1  # No retries for 404
+
+
+def test_card_reads_fields_lazily_from_payload() -> None:
+    data = {
+        "object": "card",
+        "name": "Delver of Secrets // Insectile Aberration",
+        "set": "isd",
+        "card_faces": [
+            {"name": "Delver of Secrets", "image_uris": {"png": "front.png"}},
+            {"name": "Insectile Aberration", "image_uris": {"png": "back.png"}},
+        ],
+    }
+    card = Card(data)
+
+    assert "set_code" not in vars(card)
+    assert card.set_code == "isd"
+    assert card.rarity == ""
+    assert card.card_faces is card.card_faces
+    assert card.get_best_image_url() == "front.png"
+    # Only the front face has been wrapped so far
+    assert card.card_faces._faces[1] is None
+    assert [face.name for face in card.card_faces] == [
+        "Delver of Secrets",
+        "Insectile Aberration",
+    ]
+    assert card.card_faces[-1] is card.card_faces[1:][0]
+    assert card.is_valid_card()
+
+
+@pytest.mark.parametrize(
+    ("order", "direction", "page"),
+    [(None, None, None), ("edhrec", None, None), ("usd", "desc", 2)],
+)
+def test_build_search_endpoint_encodes_like_urlencode(
+    order: str | None, direction: str | None, page: int | None
+) -> None:
+    query = "t:goblin c:r&o:haste"
+    params = {"q": query, "order": order, "dir": direction, "page": page}
+    expected = urlencode({k: str(v) for k, v in params.items() if v is not None})
+
+    client = ScryfallClient()
+    endpoint = client._build_search_endpoint(query, order, direction, page)
+
+    assert endpoint == f"/cards/search?{expected}"
+
+
+async def test_request_maps_non_json_error_body() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, text="<html>Bad Request</html>")
+
+    client = await _make_mock_client(handler)
+
+    try:
+        with pytest.raises(errors.MTGError) as exc_info:
+            await client.get_card_by_name("Lightning Bolt")
+    finally:
+        await client.close()
+
+    assert exc_info.value.error_type is errors.ErrorType.API
+    assert exc_info.value.message == "HTTP error 400"
+
+
+async def test_request_spaces_concurrent_calls_by_rate_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"object": "card", "name": "Sol Ring"})
+
+    client = await _make_mock_client(handler)
+    client.RATE_LIMIT = 0.01  # Keep the real sleeps short
+    monkeypatch.setattr(
+        "mtg_card_bot.scryfall.time", SimpleNamespace(monotonic=lambda: 50.0)
+    )
+
+    delays: list[float] = []
+    reserve = client._reserve_request_slot
+
+    def recording_reserve() -> float:
+        delays.append(reserve())
+        return delays[-1]
+
+    monkeypatch.setattr(client, "_reserve_request_slot", recording_reserve)
+
+    try:
+        await asyncio.gather(*(client.get_random_card() for _ in range(3)))
+    finally:
+        await client.close()
+
+    # Each caller claims the slot after the previous one without waiting on it
+    assert delays == pytest.approx([0.0, 0.01, 0.02])
+    assert client._next_request_at == pytest.approx(50.03)
+
+
+def test_get_format_legalities_lists_legal_formats_in_display_order() -> None:
+    card = Card(
+        {
+            "legalities": {
+                "vintage": "legal",
+                "standard": "not_legal",
+                "commander": "legal",
+                "modern": "legal",
+                "alchemy": "legal",
+            }
+        }
+    )
+
+    assert card.get_format_legalities() == "Modern, Vintage, Commander"
+    assert Card({"legalities": {"standard": "banned"}}).get_format_legalities() == (
+        "Not legal in any major formats"
+    )
+
+
+@pytest.mark.parametrize(
+    ("prices", "expected"),
+    [
+        ({"usd": "1.5", "usd_foil": "3.00", "eur": "1.20"}, "$1.50"),
+        ({"usd": None, "usd_foil": "3"}, "$3.00 (foil)"),
+        ({"usd": "n/a", "eur": "1.2"}, "€1.20"),
+        ({"tix": "0.02"}, "0.02 tix"),
+        ({"usd": None, "eur": None}, ""),
+        ({}, ""),
+    ],
+)
+def test_get_price_display_falls_back_through_currencies(
+    prices: dict[str, str | None], expected: str
+) -> None:
+    assert Card({"prices": prices}).get_price_display() == expected
+
+
+def test_card_interns_repeated_codes_in_payload_on_first_read() -> None:
+    payload = b'{"set": "neo", "rarity": "common", "legalities": {"modern": "legal"}}'
+    first_data = orjson.loads(payload)
+    second_data = orjson.loads(payload)
+    first, second = Card(first_data), Card(second_data)
+
+    # Wrapping a payload leaves it untouched
+    assert first_data["set"] is not second_data["set"]
+    assert (
+        first_data["legalities"]["modern"] is not (second_data["legalities"]["modern"])
+    )
+
+    # Reading a field interns it back into the payload, not just the property
+    assert first.set_code is second.set_code
+    assert first_data["set"] is second_data["set"]
+    assert first.legalities is first_data["legalities"]
+    second.get_format_legalities()
+    assert first_data["legalities"]["modern"] is second_data["legalities"]["modern"]
+    assert first_data["rarity"] is not second_data["rarity"]
+
+
+def test_card_tolerates_non_string_codes() -> None:
+    card = Card({"rarity": None, "legalities": {"modern": None}})
+
+    assert card.rarity == ""
+    assert card.get_format_legalities() == "Not legal in any major formats"
+
+
+def test_get_best_image_url_honours_format_preference() -> None:
+    card = Card({"image_uris": {"small": "small.jpg", "large": "large.jpg"}})
+
+    assert card.get_best_image_url() == "large.jpg"
+    assert card.get_best_image_url(("small", "large")) == "small.jpg"
+    assert card.get_best_image_url(("art_crop",)) == "small.jpg"
+    assert Card({}).get_best_image_url() == ""
+
+
+def test_scryfall_error_exposes_payload_fields() -> None:
+    error = ScryfallError(
+        {
+            "object": "error",
+            "status": 429,
+            "code": "rate_limited",
+            "details": "Too many requests",
+            "warnings": ["slow down"],
+        }
+    )
+
+    assert str(error) == "Scryfall API error: Too many requests (status: 429)"
+    assert error.get_error_type() is errors.ErrorType.RATE_LIMIT
+    assert error.code == "rate_limited"
+    assert error.type == ""
+    assert error.warnings == ["slow down"]